@@ -1,6 +1,11 @@
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterable
 from operator import itemgetter
 from difflib import get_close_matches
+from functools import partial
+from itertools import islice
+import heapq
+
+import numpy as np
 
 
 class DataProcessor:
@@ -12,8 +17,38 @@ class DataProcessor:
             data (List[Dict[str, Any]]): Исходные данные для обработки
         """
         self.original_data = data
-        self.operations: list[Any] = []
+        # Кортеж неизменяем, поэтому его можно разделять с сохранёнными
+        # запросами без копирования: каждая операция создаёт новый кортеж
+        self.operations: tuple[Any, ...] = ()
         self.available_fields = list(data[0].keys()) if data else []
+        # Источник пачек для потокового выполнения (см. from_batches)
+        self._batches: Optional[Callable[[], Iterable[List[Dict[str, Any]]]]] = None
+
+    @classmethod
+    def from_batches(
+        cls, batches: Callable[[], Iterable[List[Dict[str, Any]]]]
+    ) -> "DataProcessor":
+        """
+        Процессор над данными, которые читаются пачками, например
+        lambda: reader.iter_batches(). Запросы только из WHERE, SELECT и
+        LIMIT выполняются потоково, остальные загружают данные целиком
+
+        Args:
+            batches (Callable): Функция, возвращающая новый итератор по пачкам
+
+        Returns:
+            DataProcessor: Процессор над первой пачкой с потоковым источником
+        """
+        # Поля определяем по первой пачке, остальные пачки не читаем
+        first_batches = iter(batches())
+        try:
+            first = next(first_batches, [])
+        finally:
+            _close_iterator(first_batches)
+
+        processor = cls(first)
+        processor._batches = batches
+        return processor
 
     def select(self, fields: List[str]) -> "DataProcessor":
         """
@@ -26,7 +61,7 @@ class DataProcessor:
             DataProcessor: self для цепочки вызовов
         """
         self._validate_fields(fields)
-        self.operations.append(("select", fields))
+        self.operations += (("select", fields),)
         return self
 
     def where(self, condition: Callable[[Dict[str, Any]], bool]) -> "DataProcessor":
@@ -39,7 +74,7 @@ class DataProcessor:
         Returns:
             DataProcessor: self для цепочки вызовов
         """
-        self.operations.append(("where", condition))
+        self.operations += (("where", condition),)
         return self
 
     def sort(self, field: str, reverse: bool = False) -> "DataProcessor":
@@ -54,7 +89,7 @@ class DataProcessor:
             DataProcessor: self для цепочки вызовов
         """
         self._validate_fields([field])
-        self.operations.append(("sort", field, reverse))
+        self.operations += (("sort", field, reverse),)
         return self
 
     def group_by(
@@ -73,7 +108,7 @@ class DataProcessor:
         self._validate_fields([field])
         if aggregation:
             self._validate_fields(list(aggregation.keys()))
-        self.operations.append(("group_by", field, aggregation or {}))
+        self.operations += (("group_by", field, aggregation or {}),)
         return self
 
     def limit(self, n: int) -> "DataProcessor":
@@ -86,7 +121,7 @@ class DataProcessor:
         Returns:
             DataProcessor: self для цепочки вызовов
         """
-        self.operations.append(("limit", n))
+        self.operations += (("limit", n),)
         return self
 
     def _validate_fields(self, fields: List[str]) -> None:
@@ -128,59 +163,197 @@ class DataProcessor:
         select_ops = [op for op in self.operations if op[0] == "select"]
         limit_ops = [op for op in self.operations if op[0] == "limit"]
 
+        # SORT + LIMIT заменяем частичной сортировкой: достаточно найти n
+        # первых записей (O(N log n)) вместо сортировки всех (O(N log N))
+        if len(sort_ops) == 1 and limit_ops and min(op[1] for op in limit_ops) >= 0:
+            _, field, reverse = sort_ops[0]
+            n = min(op[1] for op in limit_ops)
+            sort_ops = [("top_n", field, reverse, n)]
+            limit_ops = []
+
         # Оптимальный порядок: WHERE -> GROUP BY -> SORT -> SELECT -> LIMIT
         optimized = where_ops + group_ops + sort_ops + select_ops + limit_ops
 
         return optimized
 
+    def _build_stages(self, operations: List[tuple]) -> List[tuple]:
+        """
+        Сборка стадий выполнения. Подряд идущие WHERE, SELECT и LIMIT
+        сливаются в одну стадию, которая проходит по данным один раз
+        без промежуточных списков
+
+        Args:
+            operations (List[tuple]): Оптимизированный список операций
+
+        Returns:
+            List[tuple]: Список стадий (название, функция над данными)
+        """
+        stages: List[tuple] = []
+        streamed: List[tuple] = []
+
+        for operation in operations + [("end",)]:
+            op_type = operation[0]
+            if op_type in ("where", "select", "limit"):
+                streamed.append(operation)
+                continue
+
+            if streamed:
+                name = "+".join(dict.fromkeys(op[0] for op in streamed))
+                stages.append((name, partial(self._apply_stream, operations=streamed)))
+                streamed = []
+
+            if op_type == "sort":
+                stages.append(
+                    (
+                        op_type,
+                        partial(
+                            self._apply_sort, field=operation[1], reverse=operation[2]
+                        ),
+                    )
+                )
+            elif op_type == "top_n":
+                stages.append(
+                    (
+                        "sort+limit",
+                        partial(
+                            self._apply_top_n,
+                            field=operation[1],
+                            reverse=operation[2],
+                            n=operation[3],
+                        ),
+                    )
+                )
+            elif op_type == "group_by":
+                stages.append(
+                    (
+                        op_type,
+                        partial(
+                            self._apply_group_by,
+                            field=operation[1],
+                            aggregation=operation[2],
+                        ),
+                    )
+                )
+
+        return stages
+
+    def _apply_stream(
+        self, data: List[Dict[str, Any]], operations: List[tuple]
+    ) -> List[Dict[str, Any]]:
+        """Применение слитых операций WHERE -> LIMIT -> SELECT за один проход"""
+        conditions = [op[1] for op in operations if op[0] == "where"]
+        selects = [op[1] for op in operations if op[0] == "select"]
+        limits = [op[1] for op in operations if op[0] == "limit"]
+
+        rows: Iterable[Dict[str, Any]] = data
+        if len(conditions) == 1:
+            rows = filter(conditions[0], rows)
+        elif conditions:
+            rows = filter(lambda item: all(cond(item) for cond in conditions), rows)
+
+        # Отрицательный LIMIT работает как срез с конца, его применяем к списку
+        if limits and min(limits) >= 0:
+            rows = islice(rows, min(limits))
+            limits = []
+
+        if selects:
+            result = self._apply_select(rows, selects[0])
+            for fields in selects[1:]:
+                result = self._apply_select(result, fields)
+        else:
+            result = list(rows)
+
+        for n in limits:
+            result = self._apply_limit(result, n)
+
+        return result
+
     def _apply_select(
-        self, data: List[Dict[str, Any]], fields: List[str]
+        self, data: Iterable[Dict[str, Any]], fields: List[str]
     ) -> List[Dict[str, Any]]:
         """Применение операции SELECT"""
+        if len(fields) == 1:
+            # Частый случай одного поля - без внутреннего цикла по полям
+            field = fields[0]
+            return [{field: item.get(field)} for item in data]
         return [{field: item.get(field) for field in fields} for item in data]
 
-    def _apply_where(
-        self, data: List[Dict[str, Any]], condition: Callable
-    ) -> List[Dict[str, Any]]:
-        """Применение операции WHERE"""
-        return [item for item in data if condition(item)]
-
     def _apply_sort(
         self, data: List[Dict[str, Any]], field: str, reverse: bool = False
     ) -> List[Dict[str, Any]]:
         """Применение операции SORT"""
         return sorted(data, key=itemgetter(field), reverse=reverse)
 
+    def _apply_top_n(
+        self, data: List[Dict[str, Any]], field: str, reverse: bool, n: int
+    ) -> List[Dict[str, Any]]:
+        """Применение слитых операций SORT + LIMIT"""
+        # Результат совпадает с sorted(...)[:n], включая порядок равных элементов
+        if reverse:
+            return heapq.nlargest(n, data, key=itemgetter(field))
+        return heapq.nsmallest(n, data, key=itemgetter(field))
+
     def _apply_group_by(
         self, data: List[Dict[str, Any]], field: str, aggregation: Dict[str, Callable]
     ) -> List[Dict[str, Any]]:
         """Применение операции GROUP BY"""
-        groups: dict[Any, Any] = {}
-        for item in data:
-            group_key = item.get(field)
-            if group_key not in groups:
-                groups[group_key] = []
-            groups[group_key].append(item)
-
-        result = []
-        for group_key, group_items in groups.items():
-            group_result = {field: group_key}
-
-            for agg_field, agg_func in aggregation.items():
-                values = [
-                    item.get(agg_field)
-                    for item in group_items
-                    if item.get(agg_field) is not None
-                ]
-                if values:
-                    group_result[agg_field] = agg_func(values)
-                else:
-                    group_result[agg_field] = None
-
-            result.append(group_result)
+        # Номер группы для каждой записи, группы - в порядке первого появления.
+        # Номера хранятся компактным массивом, а не списком объектов int
+        group_index: Dict[Any, int] = {}
+        group_ids = np.fromiter(
+            (
+                group_index.setdefault(item.get(field), len(group_index))
+                for item in data
+            ),
+            dtype=np.int32 if len(data) < 2**31 else np.int64,
+            count=len(data),
+        )
+
+        result = [{field: group_key} for group_key in group_index]
+        for agg_field, agg_func in aggregation.items():
+            aggregated = self._aggregate(
+                data, agg_field, group_ids, len(group_index), agg_func
+            )
+            for group_result, value in zip(result, aggregated):
+                group_result[agg_field] = value
 
         return result
 
+    def _aggregate(
+        self,
+        data: List[Dict[str, Any]],
+        field: str,
+        group_ids: np.ndarray,
+        n_groups: int,
+        agg_func: Callable,
+    ) -> List[Any]:
+        """Агрегация значений одного поля по группам"""
+        # Типы проверяем по строкам без списка значений: проверка
+        # останавливается на первом нецелом значении
+        integral = all(
+            type(value) is int
+            for value in (item.get(field) for item in data)
+            if value is not None
+        )
+
+        # Целочисленные поля со встроенными функциями считаем на массивах
+        if integral and agg_func in NUMERIC_AGGREGATIONS:
+            aggregated = aggregate_numeric(data, field, group_ids, n_groups, agg_func)
+            if aggregated is not None:
+                return aggregated
+
+        # Остальное - за один проход через накопители, без списков по группам.
+        # Номера групп переводим в int порциями, чтобы не копировать весь массив
+        accumulators = [make_accumulator(agg_func, integral) for _ in range(n_groups)]
+        rows = iter(data)
+        for start in range(0, len(data), GROUP_BY_CHUNK_SIZE):
+            chunk_ids = group_ids[start : start + GROUP_BY_CHUNK_SIZE].tolist()
+            for group_id, item in zip(chunk_ids, islice(rows, len(chunk_ids))):
+                value = item.get(field)
+                if value is not None:
+                    accumulators[group_id].update(value)
+        return [accumulator.finalize() for accumulator in accumulators]
+
     def _apply_limit(self, data: List[Dict[str, Any]], n: int) -> List[Dict[str, Any]]:
         """Применение операции LIMIT"""
         return data[:n]
@@ -201,30 +374,81 @@ class DataProcessor:
         # Получаем оптимизированный порядок операций
         optimized_ops = self._optimize_operations_order()
 
-        # Применяем операции последовательно
-        result = self.original_data.copy()
+        if self._batches is not None and self._is_streamable(optimized_ops):
+            result = self._execute_stream(self._batches, optimized_ops)
+            self.operations = ()
+            return result
 
-        for operation in optimized_ops:
-            op_type = operation[0]
+        # Применяем стадии последовательно. Каждая стадия возвращает новый
+        # список, поэтому исходные данные заранее не копируем
+        result = self.original_data
+        if self._batches is not None:
+            # Сортировка и группировка требуют всех данных сразу. Данные
+            # загружаются только на это выполнение, источник пачек остаётся
+            result = [row for batch in self._batches() for row in batch]
 
+        for op_type, stage in self._build_stages(optimized_ops):
             try:
-                if op_type == "select":
-                    result = self._apply_select(result, operation[1])
-                elif op_type == "where":
-                    result = self._apply_where(result, operation[1])
-                elif op_type == "sort":
-                    result = self._apply_sort(result, operation[1], operation[2])
-                elif op_type == "group_by":
-                    result = self._apply_group_by(result, operation[1], operation[2])
-                elif op_type == "limit":
-                    result = self._apply_limit(result, operation[1])
+                result = stage(result)
             except Exception as e:
                 raise RuntimeError(
                     f"Ошибка при выполнении операции {op_type}: {str(e)}"
                 )
 
         # Очищаем операции после выполнения
-        self.operations.clear()
+        self.operations = ()
+
+        # Без операций не отдаём наружу сам исходный список
+        if result is self.original_data:
+            result = result.copy()
+
+        return result
+
+    @staticmethod
+    def _is_streamable(operations: List[tuple]) -> bool:
+        """Можно ли выполнить операции по пачкам, не загружая все данные"""
+        return all(
+            op[0] in ("where", "select") or (op[0] == "limit" and op[1] >= 0)
+            for op in operations
+        )
+
+    def _execute_stream(
+        self,
+        batches: Callable[[], Iterable[List[Dict[str, Any]]]],
+        operations: List[tuple],
+    ) -> List[Dict[str, Any]]:
+        """
+        Потоковое выполнение WHERE, SELECT и LIMIT по пачкам. Чтение
+        прекращается, как только набрано нужное количество записей
+        """
+        op_type = "+".join(dict.fromkeys(op[0] for op in operations)) or "stream"
+        limits = [op[1] for op in operations if op[0] == "limit"]
+        operations = [op for op in operations if op[0] != "limit"]
+        remaining = min(limits) if limits else None
+
+        result: List[Dict[str, Any]] = []
+        if remaining == 0:
+            return result
+
+        batch_iterator = iter(batches())
+        try:
+            for batch in batch_iterator:
+                batch_ops = operations
+                if remaining is not None:
+                    batch_ops = operations + [("limit", remaining)]
+                try:
+                    rows = self._apply_stream(batch, batch_ops)
+                except Exception as e:
+                    raise RuntimeError(
+                        f"Ошибка при выполнении операции {op_type}: {str(e)}"
+                    )
+                result.extend(rows)
+                if remaining is not None:
+                    remaining -= len(rows)
+                    if remaining == 0:
+                        break
+        finally:
+            _close_iterator(batch_iterator)
 
         return result
 
@@ -249,6 +473,8 @@ class DataProcessor:
                 explanation += f"{i}. WHERE: фильтрация по условию\n"
             elif op_type == "sort":
                 explanation += f"{i}. SORT: по полю '{op[1]}' ({'убывание' if op[2] else 'возрастание'})\n"
+            elif op_type == "top_n":
+                explanation += f"{i}. SORT + LIMIT: {op[3]} записей по полю '{op[1]}' ({'убывание' if op[2] else 'возрастание'})\n"
             elif op_type == "group_by":
                 agg_info = f" с агрегацией {list(op[2].keys())}" if op[2] else ""
                 explanation += f"{i}. GROUP BY: по полю '{op[1]}'{agg_info}\n"
@@ -258,6 +484,13 @@ class DataProcessor:
         return explanation
 
 
+def _close_iterator(iterator: Iterable[Any]) -> None:
+    """Закрытие генератора, чтобы он сразу освободил файл"""
+    close = getattr(iterator, "close", None)
+    if close is not None:
+        close()
+
+
 # Вспомогательные функции для агрегации
 def avg(values: List[float]) -> float:
     """Среднее значение"""
@@ -282,3 +515,208 @@ def max_agg(values: List[Any]) -> Any:
 def min_agg(values: List[Any]) -> Any:
     """Минимальное значение"""
     return min(values) if values else None
+
+
+class Accumulator:
+    """
+    Накопитель агрегата для GROUP BY за один проход.
+    Базовая реализация собирает значения и применяет к ним функцию агрегации
+    """
+
+    def __init__(self, agg_func: Callable[[List[Any]], Any]):
+        self.agg_func = agg_func
+        self.values: List[Any] = []
+
+    def update(self, value: Any) -> None:
+        """Учесть очередное (не None) значение"""
+        self.values.append(value)
+
+    def finalize(self) -> Any:
+        """Итоговое значение агрегата, None - если значений не было"""
+        return self.agg_func(self.values) if self.values else None
+
+
+class SumAccumulator(Accumulator):
+    """Сумма без хранения значений (только для целых чисел, см. make_accumulator)"""
+
+    def __init__(self, agg_func: Callable[[List[Any]], Any]):
+        super().__init__(agg_func)
+        self.total: Any = 0
+        self.count = 0
+
+    def update(self, value: Any) -> None:
+        self.total += value
+        self.count += 1
+
+    def finalize(self) -> Any:
+        return self.total if self.count else None
+
+
+class AvgAccumulator(SumAccumulator):
+    """Среднее значение без хранения значений"""
+
+    def finalize(self) -> Any:
+        return self.total / self.count if self.count else None
+
+
+class CountAccumulator(Accumulator):
+    """Количество без хранения значений"""
+
+    def __init__(self, agg_func: Callable[[List[Any]], Any]):
+        super().__init__(agg_func)
+        self.count = 0
+
+    def update(self, value: Any) -> None:
+        self.count += 1
+
+    def finalize(self) -> Any:
+        return self.count if self.count else None
+
+
+class MaxAccumulator(Accumulator):
+    """Максимальное значение без хранения значений"""
+
+    def __init__(self, agg_func: Callable[[List[Any]], Any]):
+        super().__init__(agg_func)
+        self.has_value = False
+        self.value: Any = None
+
+    def update(self, value: Any) -> None:
+        # Как и max(), при равенстве оставляем первое значение
+        if not self.has_value or value > self.value:
+            self.value = value
+            self.has_value = True
+
+    def finalize(self) -> Any:
+        return self.value
+
+
+class MinAccumulator(MaxAccumulator):
+    """Минимальное значение без хранения значений"""
+
+    def update(self, value: Any) -> None:
+        if not self.has_value or value < self.value:
+            self.value = value
+            self.has_value = True
+
+
+# Потоковые накопители для встроенных функций агрегации
+ACCUMULATORS: Dict[Callable, type[Accumulator]] = {
+    avg: AvgAccumulator,
+    sum_agg: SumAccumulator,
+    count_agg: CountAccumulator,
+    max_agg: MaxAccumulator,
+    min_agg: MinAccumulator,
+}
+
+
+def make_accumulator(
+    agg_func: Callable[[List[Any]], Any], integral: bool = False
+) -> Accumulator:
+    """
+    Накопитель для функции агрегации (для прочих функций - базовый).
+    Сумма и среднее считаются потоково только для целых значений: для float
+    sum() складывает с компенсацией погрешности, поэтому такие значения
+    собираются и передаются в саму функцию агрегации
+    """
+    accumulator_cls = ACCUMULATORS.get(agg_func)
+    if accumulator_cls is None or (
+        not integral and issubclass(accumulator_cls, SumAccumulator)
+    ):
+        return Accumulator(agg_func)
+    return accumulator_cls(agg_func)
+
+
+# Порция строк для агрегации на массивах: временные массивы значений
+# ограничены порцией, а не числом строк
+GROUP_BY_CHUNK_SIZE = 16384
+
+NUMERIC_AGGREGATIONS = frozenset({avg, sum_agg, count_agg, max_agg, min_agg})
+
+
+def _group_reduce(
+    values: np.ndarray,
+    group_ids: np.ndarray,
+    sums: np.ndarray,
+    counts: np.ndarray,
+    mins: np.ndarray,
+    maxs: np.ndarray,
+) -> None:
+    """Добавление порции значений к суммам, количествам, минимумам и максимумам"""
+    np.add.at(sums, group_ids, values)
+    np.add.at(counts, group_ids, 1)
+    np.minimum.at(mins, group_ids, values)
+    np.maximum.at(maxs, group_ids, values)
+
+
+def aggregate_numeric(
+    data: List[Dict[str, Any]],
+    field: str,
+    group_ids: np.ndarray,
+    n_groups: int,
+    agg_func: Callable,
+) -> Optional[List[Any]]:
+    """
+    Агрегация целочисленного поля по группам на массивах numpy
+
+    Args:
+        data (List[Dict[str, Any]]): Записи, все значения поля - int или None
+        field (str): Агрегируемое поле (None пропускаются)
+        group_ids (np.ndarray): Номер группы для каждой записи
+        n_groups (int): Количество групп
+        agg_func (Callable): Одна из встроенных функций агрегации
+
+    Returns:
+        Optional[List[Any]]: Значение агрегата для каждой группы
+        или None, если сумма может выйти за пределы int64
+    """
+    sums = np.zeros(n_groups, dtype=np.int64)
+    counts = np.zeros(n_groups, dtype=np.int64)
+    mins = np.full(n_groups, np.iinfo(np.int64).max, dtype=np.int64)
+    maxs = np.full(n_groups, np.iinfo(np.int64).min, dtype=np.int64)
+
+    # Оценка сверху для модуля суммы любой группы
+    bound = 0
+    rows = iter(data)
+    for start in range(0, len(data), GROUP_BY_CHUNK_SIZE):
+        chunk_ids = group_ids[start : start + GROUP_BY_CHUNK_SIZE]
+        chunk = [item.get(field) for item in islice(rows, len(chunk_ids))]
+        present = np.fromiter(
+            (value is not None for value in chunk), dtype=bool, count=len(chunk)
+        )
+        try:
+            values = np.fromiter(
+                (0 if value is None else value for value in chunk),
+                dtype=np.int64,
+                count=len(chunk),
+            )
+        except OverflowError:
+            return None
+        if not present.all():
+            chunk_ids = chunk_ids[present]
+            values = values[present]
+        if not len(values):
+            continue
+
+        # Сумма не должна выходить за пределы int64
+        bound += max(-int(values.min()), int(values.max())) * len(values)
+        if bound >= 2**63:
+            return None
+        _group_reduce(values, chunk_ids, sums, counts, mins, maxs)
+
+    counts_list = counts.tolist()
+    aggregated: List[Any]
+    if agg_func is count_agg:
+        return [count if count else None for count in counts_list]
+    if agg_func is sum_agg:
+        aggregated = sums.tolist()
+    elif agg_func is avg:
+        aggregated = [
+            total / count if count else None
+            for total, count in zip(sums.tolist(), counts_list)
+        ]
+    elif agg_func is max_agg:
+        aggregated = maxs.tolist()
+    else:
+        aggregated = mins.tolist()
+    return [value if count else None for value, count in zip(aggregated, counts_list)]
@@ -1,7 +1,103 @@
 import csv
-from typing import List, Dict, Any
+import mmap
+import os
+from contextlib import contextmanager
+from itertools import islice
+from typing import List, Dict, Any, Optional, Callable, Iterator, Sequence
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import pyarrow as pa  # type: ignore[import]
+    import pyarrow.compute as pc  # type: ignore[import]
+    import pyarrow.csv as pa_csv  # type: ignore[import]
+except ImportError:
+    pa = None
+
+
+INT_COLUMNS = frozenset({"Size", "Stars", "Forks", "Issues", "Watchers"})
+BOOL_COLUMNS = frozenset(
+    {
+        "Has Issues",
+        "Has Projects",
+        "Has Downloads",
+        "Has Wiki",
+        "Has Pages",
+        "Has Discussions",
+        "Is Fork",
+        "Is Archived",
+        "Is Template",
+    }
+)
+TRUE_VALUES = ["true", "True", "TRUE", "1", "yes", "Yes", "YES", "y", "Y"]
+FALSE_VALUES = ["false", "False", "FALSE", "0", "no", "No", "NO", "n", "N"]
+_TRUE_SET = frozenset({"true", "1", "yes", "y"})
+# Готовые ответы для распространённых написаний, чтобы не вызывать lower()
+_BOOL_MAP = {value: True for value in TRUE_VALUES}
+_BOOL_MAP.update({value: False for value in FALSE_VALUES})
+
+
+# Функции преобразования значений непустых ячеек
+def _to_int(value: str) -> Optional[int]:
+    """Целое число (None, если значение не является числом)"""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _to_bool(value: str) -> bool:
+    """Булево значение"""
+    result = _BOOL_MAP.get(value)
+    if result is None:
+        result = value.lower() in _TRUE_SET
+    return result
+
+
+def _to_topics(value: str) -> List[str]:
+    """Список тем (предполагаем, что темы разделены запятыми)"""
+    return [topic.strip() for topic in value.split(",")]
+
+
+def _identity(value: str) -> str:
+    """Значение без преобразования"""
+    return value
+
+
+def _int_array(values: np.ndarray, missing: np.ndarray) -> np.ndarray:
+    """
+    Целая колонка: int64, а при пропусках - int64 с маской пропусков
+    (без перехода к float64, который теряет точность выше 2**53)
+    """
+    if missing.any():
+        return np.ma.MaskedArray(values, mask=missing)
+    return values
+
+
+# Целые числа, которые pyarrow и int() разбирают одинаково
+_PLAIN_INT_PATTERN = r"^[+-]?[0-9]+$"
+
+
+def _python_values(column: Any, indices: Optional[np.ndarray] = None) -> List[Any]:
+    """
+    Значения колонки хранилища в виде питоновских объектов
+
+    Args:
+        column (np.ndarray | List[Any]): Колонка хранилища
+        indices (np.ndarray): Индексы строк, по умолчанию все строки
+
+    Returns:
+        List[Any]: Список значений колонки
+    """
+    if not isinstance(column, np.ndarray):
+        if indices is None:
+            return list(column)
+        return [column[i] for i in indices.tolist()]
+
+    # Для MaskedArray tolist() возвращает None на месте пропусков
+    return (column if indices is None else column[indices]).tolist()
+
 
 class CSVReader:
     def __init__(self, file_path: str):
@@ -38,20 +134,47 @@ class CSVReader:
             "Is Template",
             "Default Branch",
         ]
+        # Данные хранятся по колонкам: числовые и булевы - в np.ndarray
+        # (целые с пропусками - в np.ma.MaskedArray), остальные - в списках.
+        # Строки-словари собираются лениво в get_data()
+        self.columns: Dict[str, Any] = {}
         self.data: list[Any] = []
+        # Ключ кэша (mtime, размер, параметры чтения) последнего прочитанного файла
+        self._cache_key: Optional[tuple] = None
+        # pd.DataFrame по колонке Language, строится при первом фильтре по языку
+        self._frame: Optional[Any] = None
+        # Индекс по Stars (порядок строк и отсортированные значения),
+        # строится при первом фильтре по звёздам
+        self._stars_index: Optional[tuple] = None
+        # Были ли прочитаны все колонки файла
+        self._all_columns_cached = False
+        # Таблица преобразований: колонка -> функция, строится один раз
+        # Topics хранится исходной строкой и разбирается в get_topics()
+        self._converters: Dict[str, Callable[[str], Any]] = {
+            column: _to_int for column in INT_COLUMNS
+        }
+        self._converters.update({column: _to_bool for column in BOOL_COLUMNS})
 
     def read_csv(
-        self, delimiter: str = ",", encoding: str = "utf-8"
+        self,
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+        columns: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Чтение CSV файла
+        Чтение CSV файла. Повторный вызов для неизменённого файла
+        возвращает уже прочитанные данные без повторного разбора
 
         Args:
             delimiter (str): Разделитель в CSV файле
             encoding (str): Кодировка файла
+            columns (List[str]): Колонки, которые нужно прочитать.
+                Остальные колонки не преобразуются и не хранятся.
+                По умолчанию читаются все колонки
 
         Returns:
-            List[Dict[str, Any]]: Список словарей с данными
+            List[Dict[str, Any]]: Список словарей с данными. Строки содержат
+            только запрошенные колонки, даже если прочитано больше
 
         Raises:
             FileNotFoundError: Если файл не найден
@@ -60,61 +183,387 @@ class CSVReader:
         if not Path(self.file_path).exists():
             raise FileNotFoundError(f"Файл {self.file_path} не найден")
 
+        stat = os.stat(self.file_path)
+        cache_key = (stat.st_mtime_ns, stat.st_size, delimiter, encoding)
+        if cache_key == self._cache_key and (
+            self._all_columns_cached
+            if columns is None
+            else self.columns.keys() >= set(columns)
+        ):
+            if columns is None or self.columns.keys() == set(columns):
+                return self.get_data()
+            # Из кэша с лишними колонками отдаём только запрошенные
+            requested = set(columns)
+            return self._gather_rows(
+                names=[name for name in self.columns if name in requested]
+            )
+
         self.data = []
+        self._frame = None
+        self._stars_index = None
+        self._cache_key = None
+        self._all_columns_cached = columns is None
 
-        with open(self.file_path, "r", encoding=encoding) as file:
-            reader = csv.DictReader(file, delimiter=delimiter)
+        if pa is not None:
+            table = self._read_arrow(delimiter, encoding, columns)
+            self.columns = {
+                name: self._arrow_column(name, table.column(name))
+                for name in table.column_names
+            }
+            self._cache_key = cache_key
+            return self.get_data()
 
-            # Проверяем наличие всех ожидаемых колонок
-            missing_columns = set(self.expected_columns) - set(reader.fieldnames or [])
-            if missing_columns:
-                raise ValueError(f"Отсутствуют колонки: {missing_columns}")
+        with self._map_lines(encoding) as lines:
+            reader = csv.reader(lines, delimiter=delimiter)
+            header = next(reader, [])
 
+            names = self._select_columns(header, columns)
+            values: Dict[str, List[Any]] = {name: [] for name in names}
+            plan = self._build_plan(header, values)
+            width = len(header)
             for row in reader:
+                if not row:
+                    continue
+                if len(row) < width:
+                    row += [""] * (width - len(row))
                 # Преобразуем данные к правильным типам
-                processed_row = self._process_row(row)
-                self.data.append(processed_row)
+                self._process_row(row, plan)
 
-        return self.data
+        self.columns = {
+            name: self._to_array(name, column) for name, column in values.items()
+        }
+        self._cache_key = cache_key
+        return self.get_data()
+
+    def iter_batches(
+        self,
+        batch_size: int = 10000,
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Потоковое чтение CSV файла пачками строк. В памяти одновременно
+        находится только текущая пачка, прочитанные данные не кэшируются
+
+        Args:
+            batch_size (int): Количество строк в пачке
+            delimiter (str): Разделитель в CSV файле
+            encoding (str): Кодировка файла
+            columns (List[str]): Колонки, которые нужно прочитать.
+                По умолчанию читаются все колонки
+
+        Yields:
+            List[Dict[str, Any]]: Очередная пачка строк
+
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если размер пачки не положительный или структура CSV
+                не соответствует ожидаемой
+        """
+        if not Path(self.file_path).exists():
+            raise FileNotFoundError(f"Файл {self.file_path} не найден")
+        if batch_size <= 0:
+            raise ValueError(f"Размер пачки должен быть положительным: {batch_size}")
+
+        if pa is not None:
+            yield from self._iter_arrow_batches(
+                batch_size, delimiter, encoding, columns
+            )
+        else:
+            yield from self._iter_csv_batches(batch_size, delimiter, encoding, columns)
+
+    def _iter_arrow_batches(
+        self,
+        batch_size: int,
+        delimiter: str,
+        encoding: str,
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Потоковое чтение пачками через pyarrow.csv.open_csv"""
+        read_options, parse_options = self._arrow_options(delimiter, encoding)
+
+        try:
+            convert_options = self._arrow_convert_options(
+                read_options, parse_options, columns
+            )
+            with pa_csv.open_csv(
+                self.file_path,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            ) as stream:
+                names = stream.schema.names
+                # Блоки pyarrow не совпадают с размером пачки - перекладываем
+                pending: List[Dict[str, Any]] = []
+                for record_batch in stream:
+                    values = [
+                        _python_values(
+                            self._arrow_column(name, record_batch.column(name))
+                        )
+                        for name in names
+                    ]
+                    pending.extend(dict(zip(names, row)) for row in zip(*values))
+                    while len(pending) >= batch_size:
+                        yield pending[:batch_size]
+                        del pending[:batch_size]
+                if pending:
+                    yield pending
+        except pa.ArrowInvalid as e:
+            raise ValueError(f"Некорректные данные в CSV: {e}") from e
+
+    def _iter_csv_batches(
+        self,
+        batch_size: int,
+        delimiter: str,
+        encoding: str,
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Потоковое чтение пачками через csv.reader"""
+        with self._map_lines(encoding) as lines:
+            reader = csv.reader(lines, delimiter=delimiter)
+            header = next(reader, [])
 
-    def _process_row(self, row: Dict[str, str]) -> Dict[str, Any]:
+            names = self._select_columns(header, columns)
+            width = len(header)
+            rows = (row for row in reader if row)
+            while chunk := list(islice(rows, batch_size)):
+                values: Dict[str, List[Any]] = {name: [] for name in names}
+                plan = self._build_plan(header, values)
+                for row in chunk:
+                    if len(row) < width:
+                        row += [""] * (width - len(row))
+                    self._process_row(row, plan)
+                yield [dict(zip(names, record)) for record in zip(*values.values())]
+
+    def _select_columns(
+        self, header: Sequence[str], columns: Optional[List[str]] = None
+    ) -> List[str]:
         """
-        Обработка строки данных - преобразование типов
+        Проверка заголовка и выбор читаемых колонок
 
         Args:
-            row (Dict[str, str]): Сырая строка из CSV
+            header (Sequence[str]): Колонки из заголовка файла
+            columns (List[str]): Запрошенные колонки, None - все
 
         Returns:
-            Dict[str, Any]: Обработанная строка с правильными типами
-        """
-        processed: dict[Any, Any] = {}
-
-        for key, value in row.items():
-            if value == "" or value is None:
-                processed[key] = None
-            elif key in ["Size", "Stars", "Forks", "Issues", "Watchers"]:
-                processed[key] = int(value) if value.isdigit() else None
-            elif key in [
-                "Has Issues",
-                "Has Projects",
-                "Has Downloads",
-                "Has Wiki",
-                "Has Pages",
-                "Has Discussions",
-                "Is Fork",
-                "Is Archived",
-                "Is Template",
-            ]:
-                processed[key] = value.lower() in ["true", "1", "yes", "y"]
-            elif key == "Topics":
-                # Предполагаем, что темы разделены запятыми
-                processed[key] = (
-                    [topic.strip() for topic in value.split(",")] if value else []
+            List[str]: Читаемые колонки в порядке следования в файле
+
+        Raises:
+            ValueError: Если в файле нет ожидаемых или запрошенных колонок
+        """
+        # Проверяем наличие всех ожидаемых колонок
+        required_columns = set(self.expected_columns) | set(columns or [])
+        missing_columns = required_columns - set(header)
+        if missing_columns:
+            raise ValueError(f"Отсутствуют колонки: {missing_columns}")
+
+        if columns is None:
+            return list(header)
+        requested = set(columns)
+        return [name for name in header if name in requested]
+
+    def _read_arrow(
+        self, delimiter: str, encoding: str, columns: Optional[List[str]] = None
+    ) -> Any:
+        """
+        Чтение CSV файла средствами pyarrow (нативный многопоточный парсер)
+
+        Args:
+            delimiter (str): Разделитель в CSV файле
+            encoding (str): Кодировка файла
+            columns (List[str]): Читаемые колонки, None - все
+
+        Returns:
+            pa.Table: Таблица строковых колонок
+
+        Raises:
+            ValueError: Если структура CSV не соответствует ожидаемой
+        """
+        read_options, parse_options = self._arrow_options(delimiter, encoding)
+
+        try:
+            convert_options = self._arrow_convert_options(
+                read_options, parse_options, columns
+            )
+            with pa.memory_map(self.file_path) as source:
+                table = pa_csv.read_csv(
+                    source,
+                    read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options,
                 )
-            else:
-                processed[key] = value
+        except pa.ArrowInvalid as e:
+            raise ValueError(f"Некорректные данные в CSV: {e}") from e
+
+        return table
+
+    @staticmethod
+    def _arrow_options(delimiter: str, encoding: str) -> tuple:
+        """Параметры чтения и разбора CSV для pyarrow"""
+        read_options = pa_csv.ReadOptions(encoding=encoding)
+        parse_options = pa_csv.ParseOptions(
+            delimiter=delimiter, newlines_in_values=True
+        )
+        return read_options, parse_options
+
+    def _arrow_convert_options(
+        self, read_options: Any, parse_options: Any, columns: Optional[List[str]]
+    ) -> Any:
+        """
+        Параметры преобразования колонок для pyarrow. Заголовок читаем
+        заранее, чтобы проверить структуру файла. Все колонки читаются
+        строками без вывода типов, как в разборе через csv.reader:
+        числа и булевы значения приводятся в _arrow_column
+
+        Raises:
+            ValueError: Если в файле нет ожидаемых или запрошенных колонок
+        """
+        with pa_csv.open_csv(
+            self.file_path, read_options=read_options, parse_options=parse_options
+        ) as stream:
+            header = stream.schema.names
+        return pa_csv.ConvertOptions(
+            include_columns=self._select_columns(header, columns),
+            column_types={column: pa.string() for column in header},
+            null_values=[""],
+            strings_can_be_null=True,
+        )
+
+    def _build_plan(
+        self, header: Sequence[str], values: Dict[str, List[Any]]
+    ) -> List[tuple]:
+        """
+        План разбора строк для _process_row. Позиции колонок определяются
+        один раз по заголовку
+
+        Args:
+            header (Sequence[str]): Колонки из заголовка файла
+            values (Dict[str, List[Any]]): Списки для значений читаемых колонок
+
+        Returns:
+            List[tuple]: Тройки (колонка, позиция в строке, функция преобразования)
+        """
+        positions = {name: i for i, name in enumerate(header)}
+        return [
+            (column, positions[name], self._converters.get(name, _identity))
+            for name, column in values.items()
+        ]
+
+    @contextmanager
+    def _map_lines(self, encoding: str) -> Iterator[Iterator[str]]:
+        """
+        Построчное чтение файла, отображённого в память через mmap
+
+        Args:
+            encoding (str): Кодировка файла
+
+        Yields:
+            Iterator[str]: Итератор по строкам файла
+        """
+        # Деление байтов по b"\n" до декодирования верно только для
+        # ASCII-совместимых кодировок, остальные (utf-16, utf-32) читаем
+        # обычным текстовым потоком
+        if "\n".encode(encoding) != b"\n":
+            with open(self.file_path, encoding=encoding, newline="") as text:
+                yield text
+            return
+
+        with open(self.file_path, "rb") as file:
+            # Пустой файл нельзя отобразить в память
+            if os.fstat(file.fileno()).st_size == 0:
+                yield iter(())
+                return
 
-        return processed
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield (line.decode(encoding) for line in iter(mapped.readline, b""))
+
+    @staticmethod
+    def _arrow_column(column_name: str, column: Any) -> Any:
+        """
+        Преобразование строковой колонки pyarrow в колонку хранилища
+        по тем же правилам, что у _to_int и _to_bool
+
+        Args:
+            column_name (str): Название колонки
+            column (pa.Array | pa.ChunkedArray): Колонка строк
+
+        Returns:
+            np.ndarray | List[Any]: Массив для числовых и булевых колонок,
+            список для остальных
+        """
+        if column_name in INT_COLUMNS:
+            # Быстрый путь - все значения записаны обычными целыми числами
+            if pc.all(
+                pc.match_substring_regex(column, _PLAIN_INT_PATTERN), min_count=0
+            ).as_py():
+                try:
+                    integers = pc.cast(column, pa.int64())
+                except pa.ArrowInvalid:
+                    # Значение за пределами int64 - разбираем как в csv-пути
+                    pass
+                else:
+                    return _int_array(
+                        integers.fill_null(0).to_numpy(zero_copy_only=False),
+                        integers.is_null().to_numpy(zero_copy_only=False),
+                    )
+            values = [
+                None if value is None else _to_int(value)
+                for value in column.to_pylist()
+            ]
+            return CSVReader._to_array(column_name, values)
+        if column_name in BOOL_COLUMNS:
+            flags = pc.is_in(
+                pc.utf8_lower(column), value_set=pa.array(sorted(_TRUE_SET))
+            )
+            # Пропуски в булевых колонках превращаются в None (object)
+            return pc.if_else(
+                pc.is_null(column), pa.scalar(None, pa.bool_()), flags
+            ).to_numpy(zero_copy_only=False)
+        return column.to_pylist()
+
+    @staticmethod
+    def _to_array(column_name: str, values: List[Any]) -> Any:
+        """
+        Упаковка значений колонки в np.ndarray для числовых и булевых колонок
+
+        Args:
+            column_name (str): Название колонки
+            values (List[Any]): Значения колонки
+
+        Returns:
+            np.ndarray | List[Any]: Массив или исходный список
+        """
+        if column_name in INT_COLUMNS:
+            missing = np.fromiter(
+                (value is None for value in values), dtype=bool, count=len(values)
+            )
+            filled = [0 if value is None else value for value in values]
+            try:
+                array = np.asarray(filled, dtype=np.int64)
+            except OverflowError:
+                # Значения за пределами int64 храним питоновскими int
+                return values
+            return _int_array(array, missing)
+        if column_name in BOOL_COLUMNS:
+            if None in values:
+                return np.array(values, dtype=object)
+            return np.asarray(values, dtype=bool)
+        return values
+
+    @staticmethod
+    def _process_row(row: List[str], plan: List[tuple]) -> None:
+        """
+        Обработка строки данных - преобразование типов и запись в колонки
+
+        Args:
+            row (List[str]): Сырая строка из CSV
+            plan (List[tuple]): Тройки (колонка, позиция в строке, функция
+                преобразования) для каждой читаемой колонки
+        """
+        for column, position, convert in plan:
+            value = row[position]
+            column.append(convert(value) if value else None)
 
     def get_data(self) -> List[Dict[str, Any]]:
         """
@@ -123,8 +572,46 @@ class CSVReader:
         Returns:
             List[Dict[str, Any]]: Список словарей с данными
         """
+        # Строки собираются из колонок только по запросу
+        if self.columns and not self.data:
+            self.data = self._gather_rows()
         return self.data
 
+    def _column_values(
+        self, column_name: str, indices: Optional[np.ndarray] = None
+    ) -> List[Any]:
+        """
+        Значения колонки в виде питоновских объектов
+
+        Args:
+            column_name (str): Название колонки
+            indices (np.ndarray): Индексы строк, по умолчанию все строки
+
+        Returns:
+            List[Any]: Список значений колонки
+        """
+        return _python_values(self.columns[column_name], indices)
+
+    def _gather_rows(
+        self,
+        indices: Optional[np.ndarray] = None,
+        names: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Сборка строк-словарей из колонок
+
+        Args:
+            indices (np.ndarray): Индексы строк, по умолчанию все строки
+            names (List[str]): Колонки строк, по умолчанию все прочитанные
+
+        Returns:
+            List[Dict[str, Any]]: Список словарей с данными
+        """
+        if names is None:
+            names = list(self.columns)
+        values = [self._column_values(name, indices) for name in names]
+        return [dict(zip(names, row)) for row in zip(*values)]
+
     def get_column(self, column_name: str) -> List[Any]:
         """
         Получить значения конкретной колонки
@@ -140,5 +627,124 @@ class CSVReader:
         """
         if column_name not in self.expected_columns:
             raise ValueError(f"Колонка {column_name} не существует")
+        self._require_columns(column_name)
+
+        return self._column_values(column_name)
+
+    def _require_columns(self, *column_names: str) -> None:
+        """
+        Проверка, что колонки были прочитаны
+
+        Raises:
+            ValueError: Если колонка не прочитана
+        """
+        for column_name in column_names:
+            if column_name not in self.columns:
+                raise ValueError(f"Колонка {column_name} не прочитана")
+
+    @staticmethod
+    def get_topics(row: Dict[str, Any]) -> List[str]:
+        """
+        Получить темы репозитория. Темы хранятся исходной строкой
+        и разбиваются на список только по запросу
+
+        Args:
+            row (Dict[str, Any]): Строка данных
+
+        Returns:
+            List[str]: Список тем
+        """
+        value = row.get("Topics")
+        return _to_topics(value) if value else []
+
+    def filter_by_min_stars(self, min_stars: int) -> List[Dict[str, Any]]:
+        """
+        Репозитории с количеством звёзд не меньше заданного
+
+        Args:
+            min_stars (int): Минимальное количество звёзд
+
+        Returns:
+            List[Dict[str, Any]]: Список словарей с данными
+
+        Raises:
+            ValueError: Если колонка Stars не прочитана
+        """
+        if not self.columns:
+            return []
+        self._require_columns("Stars")
 
-        return [row.get(column_name) for row in self.data]
+        # Один раз сортируем строки по звёздам, дальше каждый фильтр -
+        # бинарный поиск границы
+        stars = self.columns["Stars"]
+        if not isinstance(stars, np.ndarray):
+            # Значения за пределами int64 хранятся списком питоновских int
+            indices = [
+                i
+                for i, value in enumerate(stars)
+                if value is not None and value >= min_stars
+            ]
+            return self._gather_rows(np.array(indices, dtype=np.intp))
+
+        if self._stars_index is None:
+            # Пропуски в индекс не попадают
+            present = np.flatnonzero(~np.ma.getmaskarray(stars))
+            values = np.ma.getdata(stars)[present]
+            order = np.argsort(values, kind="stable")
+            self._stars_index = (present[order], values[order])
+
+        order, sorted_stars = self._stars_index
+        start = int(np.searchsorted(sorted_stars, min_stars, side="left"))
+
+        # Возвращаем строки в исходном порядке файла
+        return self._gather_rows(np.sort(order[start:]))
+
+    def filter_by_language(self, language: str) -> List[Dict[str, Any]]:
+        """
+        Репозитории на заданном языке
+
+        Args:
+            language (str): Язык программирования
+
+        Returns:
+            List[Dict[str, Any]]: Список словарей с данными
+
+        Raises:
+            ValueError: Если колонка Language не прочитана
+        """
+        if not self.columns:
+            return []
+        self._require_columns("Language")
+
+        frame = self._get_frame()
+        if frame is not None:
+            mask = (frame["Language"] == language).to_numpy(dtype=bool)
+            return self._gather_rows(np.flatnonzero(mask))
+
+        indices = np.array(
+            [
+                i
+                for i, value in enumerate(self.columns["Language"])
+                if value == language
+            ],
+            dtype=np.intp,
+        )
+        return self._gather_rows(indices)
+
+    def _get_frame(self) -> Any:
+        """
+        DataFrame по колонке Language для векторного фильтра по языку
+
+        Returns:
+            pd.DataFrame: Таблица с колонкой Language
+            или None, если pandas не установлен
+        """
+        if self._frame is None:
+            # pandas импортируется только здесь: импорт занимает заметное
+            # время, а остальным методам ридера он не нужен
+            try:
+                import pandas as pd  # type: ignore[import]
+            except ImportError:
+                return None
+            self._frame = pd.DataFrame({"Language": self.columns["Language"]})
+        return self._frame
@@ -1,5 +1,6 @@
 import csv
-from typing import Any
+from collections import Counter
+from typing import Any, Optional
 
 from csv_hendler import DataProcessor
 from csv_reader import CSVReader
@@ -76,6 +77,32 @@ class Stat:
 
         return self.result
 
+    def get_summary(self) -> dict[str, Any]:
+        self.csv_reader.read_csv()
+        columns = self.csv_reader.columns
+
+        total = len(columns["Stars"]) if columns else 0
+        if not total:
+            return {
+                "total_repositories": 0,
+                "avg_stars": None,
+                "avg_forks": None,
+                "most_popular_language": None,
+            }
+
+        # Подсчёт языков за один проход на C, пропуски убираем из результата
+        languages = Counter(columns["Language"])
+        languages.pop(None, None)
+        languages.pop("", None)
+        most_popular = languages.most_common(1)[0][0] if languages else None
+
+        return {
+            "total_repositories": total,
+            "avg_stars": _column_mean(columns["Stars"]),
+            "avg_forks": _column_mean(columns["Forks"]),
+            "most_popular_language": most_popular,
+        }
+
     def to_csv(self, filename: str):
         with open(filename, "w", encoding="utf-8", newline="") as file:
             fieldnames = self.result[0].keys()
@@ -86,6 +113,17 @@ class Stat:
                 writer.writerow(self.result[i])
 
 
+def _column_mean(column: Any) -> Optional[float]:
+    # Целые колонки ридера: np.ndarray (с маской пропусков) или список int
+    if isinstance(column, np.ndarray):
+        if not np.ma.count(column):
+            return None
+        # Накопление во float64, чтобы сумма не переполняла int64
+        return float(np.ma.mean(column, dtype=np.float64))
+    values = [value for value in column if value is not None]
+    return sum(values) / len(values) if values else None
+
+
 if __name__ == "__main__":
     csv_reader = CSVReader("repositories.csv")
     stat = Stat(csv_reader)
@@ -45,7 +45,8 @@ class User:
             "id": query_id,
             "name": name,
             "description": description,
-            "operations": self.current_processor.operations.copy(),
+            # Операции - неизменяемый кортеж, копировать его не нужно
+            "operations": self.current_processor.operations,
             "created_at": datetime.now().isoformat(),
         }
 
@@ -68,9 +69,7 @@ class User:
             raise ValueError("Сначала установите процессор данных")
 
         # Загружаем операции из сохраненного запроса
-        self.current_processor.operations = self.saved_queries[query_id][
-            "operations"
-        ].copy()
+        self.current_processor.operations = self.saved_queries[query_id]["operations"]
         return self.current_processor
 
     def load_query_by_name(self, name: str) -> DataProcessor:
@@ -4,7 +4,7 @@ from homework_oop.csv_reader import CSVReader
 
 def main():
     csv_reader = CSVReader(r"homework_oop/repositories.csv")
-    data = csv_reader.read_csv()
+    data = csv_reader.read_csv(columns=["Has Pages", "Stars", "Forks"])
 
     processor = DataProcessor(data)
     result = (processor